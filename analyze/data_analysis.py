@@ -8,11 +8,8 @@ import traceback
 import warnings
 
 # Third-party
-from functools import reduce
-
 import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
+from matplotlib.ticker import StrMethodFormatter
 import pandas as pd
 import numpy as np
 import re
@@ -21,6 +18,52 @@ warnings.filterwarnings("ignore")
 # Third-party
 from wordcloud import STOPWORDS, WordCloud  # noqa: E402
 
+# Flickr license ids and the cleaned dataset collected for each of them
+LICENSE_IDS = [1, 2, 3, 4, 5, 6, 9, 10]
+CLEANED_LICENSE_CSVS = [
+    f"../flickr/dataset/cleaned_license{license_id}.csv"
+    for license_id in LICENSE_IDS
+]
+LICENSE_LABELS = [
+    "CC BY-NC-SA 2.0",
+    "CC BY-NC 2.0",
+    "CC BY-NC-ND 2.0",
+    "CC BY 2.0",
+    "CC BY-SA 2.0",
+    "CC BY-ND 2.0",
+    "CC0 1.0",
+    "Public Domain Mark 1.0",
+]
+LICENSE_LINESTYLES = ["-", "--", "-.", ":", "-", "--", ":", "-"]
+
+# Stop words of the tag word clouds, built once for every call
+# The stop words can be customized based on diff cases
+TAGS_STOPWORDS = set(STOPWORDS).union({
+    "nan", "https", "href", "rel", "de", "en",
+    "et", "un", "el", "le", "un", "est", "à", "lo",
+    "da", "la", "href", "rel", "noreferrer",
+    "nofollow", "ly", "photo", "qui", "que", "dan",
+    "pa", "ou", "quot", "rolandtanglaophoto",
+})
+# customized = {"p", "d", "b"}
+# TAGS_STOPWORDS = TAGS_STOPWORDS.union(customized)
+
+# Splits descriptions on whitespace, and on commas and periods that are
+# not part of a number
+DESCRIPTION_SPLIT_RE = re.compile(r"\s|(?<!\d)[,.](?!\d)")
+
+
+def load_cleaned_licenses(usecols=None):
+    """
+    This function is to read the cleaned dataset of every license
+    usecols is the list of columns to read, or None for all of them
+    returns a list of dataframes in the order of LICENSE_IDS
+    """
+    return [
+        pd.read_csv(csv_path, usecols=usecols)
+        for csv_path in CLEANED_LICENSE_CSVS
+    ]
+
 
 def tags_frequency(csv_path, column_names):
     # attribute csv_path is string
@@ -31,7 +74,7 @@ def tags_frequency(csv_path, column_names):
     based on all the tags of each license
     each license one cloud
     """
-    df = pd.read_csv(csv_path)
+    df = pd.read_csv(csv_path, usecols=column_names)
     for column_name in column_names:
         list2 = []
         if column_name == "tags":
@@ -39,67 +82,50 @@ def tags_frequency(csv_path, column_names):
 
             # Converting string to list
             for row in df[column_name][1:]:
-                if str(row).strip("]'[").split("', '"):
-                    list_tags += str(row).strip("]'[").split("', '")
+                row_tags = str(row).strip("]'[").split("', '")
+                if row_tags:
+                    list_tags += row_tags
         else:
             for row in df[column_name][1:]:
-                if str(row) is not None and str(row) != "" and str(row) != "nan":
-                    print(str(row))
-                    if "ChineseinUS.org" in str(row):
-                        row = "ChineseinUS"
-                    list2 += re.split('\s|(?<!\d)[,.](?!\d)', str(row))
-    text = ""
-    stopwords = set(STOPWORDS)
-
-    # The stop words can be customized based on diff cases
-    flickr_customized = {"nan", "https", "href", "rel", "de", "en",
-                         "et", "un", "el", "le", "un", "est", "à", "lo",
-                         "da", "la", "href", "rel", "noreferrer",
-                         "nofollow", "ly", "photo", "qui", "que", "dan",
-                         "pa", "ou", "quot", "rolandtanglaophoto"}
-    stopwords = stopwords.union(flickr_customized)
-    # customized = {"p", "d", "b"}
-    # stopwords = stopwords.union(customized)
-
-    for word in list_tags:
-        # Splitting each tag into its constituent words
-        tokens = word.split()
-        # Converting each word to lower case
-        for i in range(len(tokens)):
-            tokens[i] = tokens[i].lower()
-        # Adding each word to text
-        text += " ".join(tokens) + " "
-    for word in list2:
-        tokens = word.split()
-        for j in range(len(tokens)):
-            tokens[j] = tokens[j].lower()
-        text += " ".join(tokens) + " "
+                # convert each row to a string only once
+                row_text = str(row)
+                if row_text != "" and row_text != "nan":
+                    print(row_text)
+                    if "ChineseinUS.org" in row_text:
+                        row_text = "ChineseinUS"
+                    list2 += DESCRIPTION_SPLIT_RE.split(row_text)
+    # Splitting each tag and description into its constituent words,
+    # converting each word to lower case and joining them all into text
+    # in one pass rather than growing the string word by word
+    text = "".join(
+        " ".join(word.split()).lower() + " "
+        for words in (list_tags, list2)
+        for word in words
+    )
 
     # Creating the word cloud
     tags_word_cloud = WordCloud(
         width=800,
         height=800,
         background_color="white",
-        stopwords=stopwords,
+        stopwords=TAGS_STOPWORDS,
         min_font_size=10,
     ).generate(text)
 
     # Plotting the word cloud
-    plt.figure(figsize=(8, 8), facecolor=None)
+    fig = plt.figure(figsize=(8, 8), facecolor=None)
     plt.imshow(tags_word_cloud, interpolation="bilinear")
     plt.axis("off")
     plt.title("Flickr Photos under Creative Commons Licenses: Categories Keywords", fontweight="bold")
     plt.savefig('../analyze/wordCloud_plots/license1_wordCloud.png',
                 dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
 
 
 def time_trend_helper(df):
-    year_list = []
-    for date_row in df['dates'][0:]:
-        date_list = str(date_row).split()
-        year_list.append(date_list[0])
-    df['Dates'] = year_list
+    # Keep the day part of each "YYYY-MM-DD hh:mm:ss" timestamp
+    df['Dates'] = df['dates'].astype(str).str.split().str[0]
 
     # Use rename_axis for name of column from index and reset_index
     count_df = df['Dates'].value_counts().sort_index(). \
@@ -109,7 +135,7 @@ def time_trend_helper(df):
 
 
 def time_trend(csv_path):
-    df = pd.read_csv(csv_path)
+    df = pd.read_csv(csv_path, usecols=["dates"])
     count_df = time_trend_helper(df)
 
     # first use subplots() to create a frame of your plot (figure and axes)
@@ -132,6 +158,7 @@ def time_trend(csv_path):
     plt.savefig('../analyze/line_graphs/license5_total_trend.png',
                 dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
 
 
 def time_trend_compile_helper(yearly_count):
@@ -141,12 +168,10 @@ def time_trend_compile_helper(yearly_count):
     condition that their corresponding "year" is between [2000, 2022]
     """
     Years = np.arange(2018, 2023)
-    yearly_count["year"] = list(yearly_count.index)
-    counts = []
-    for num in range(len(yearly_count["Counts"])):
-        if ((int(yearly_count["year"][num]) <= 2022)
-                & (int(yearly_count["year"][num]) >= 2018)):
-            counts.append(yearly_count["Counts"][num])
+    # compare all the years against the range at once
+    years = yearly_count.index.astype(int)
+    in_range = (years >= 2018) & (years <= 2022)
+    counts = yearly_count["Counts"][in_range].tolist()
     print(counts)
     final_yearly_count = pd.DataFrame(list(zip(Years, counts)),
                     columns=['Years', 'Yearly_counts'])
@@ -154,65 +179,37 @@ def time_trend_compile_helper(yearly_count):
 
 
 def time_trend_compile():
-    license1 = pd.read_csv("../flickr/dataset/cleaned_license1.csv")
-    license2 = pd.read_csv("../flickr/dataset/cleaned_license2.csv")
-    license3 = pd.read_csv("../flickr/dataset/cleaned_license3.csv")
-    license4 = pd.read_csv("../flickr/dataset/cleaned_license4.csv")
-    license5 = pd.read_csv("../flickr/dataset/cleaned_license5.csv")
-    license6 = pd.read_csv("../flickr/dataset/cleaned_license6.csv")
-    license9 = pd.read_csv("../flickr/dataset/cleaned_license9.csv")
-    license10 = pd.read_csv("../flickr/dataset/cleaned_license10.csv")
-    count_df1 = time_trend_helper(license1)
-    count_df2 = time_trend_helper(license2)
-    count_df3 = time_trend_helper(license3)
-    count_df4 = time_trend_helper(license4)
-    count_df5 = time_trend_helper(license5)
-    count_df6 = time_trend_helper(license6)
-    count_df9 = time_trend_helper(license9)
-    count_df10 = time_trend_helper(license10)
-    list_raw_data = [count_df1, count_df2, count_df3, count_df4,
-                     count_df5, count_df6, count_df9, count_df10]
-
-    # Split date to year and save in a list
-    list_data = []
-    for each_raw_data in list_raw_data:
-        years = []
-        for row in each_raw_data["Dates"]:
-            years.append(row.split("-")[0])
-        each_raw_data["Years"] = years
-        each_raw_data = each_raw_data.drop("Dates", axis=1)
-        each_raw_data = each_raw_data.groupby("Years")["Counts"].sum()
-        each_raw_data.dropna(how='all')
-        list_data.append(each_raw_data)
+    list_raw_data = [
+        time_trend_helper(df) for df in load_cleaned_licenses(["dates"])
+    ]
+
+    # Sum the daily counts of each license by the year of its date
+    list_data = [
+        each_raw_data.groupby(
+            each_raw_data["Dates"].str.split("-").str[0].rename("Years")
+        )["Counts"].sum()
+        for each_raw_data in list_raw_data
+    ]
 
     # We set years are from 2000 to 2022
-    yearly_count1 = list_data[0].to_frame()
-    yearly_count2 = list_data[1].to_frame()
-    yearly_count3 = list_data[2].to_frame()
-    yearly_count4 = list_data[3].to_frame()
-    yearly_count5 = list_data[4].to_frame()
-    yearly_count6 = list_data[5].to_frame()
-    yearly_count9 = list_data[6].to_frame()
-    yearly_count10 = list_data[7].to_frame()
-    yearly_count1 = time_trend_compile_helper(yearly_count1)
-    yearly_count2 = time_trend_compile_helper(yearly_count2)
-    yearly_count3 = time_trend_compile_helper(yearly_count3)
-    yearly_count4 = time_trend_compile_helper(yearly_count4)
-    yearly_count5 = time_trend_compile_helper(yearly_count5)
-    yearly_count6 = time_trend_compile_helper(yearly_count6)
-    yearly_count9 = time_trend_compile_helper(yearly_count9)
-    yearly_count10 = time_trend_compile_helper(yearly_count10)
-    print(yearly_count1)
-
-    # plot lines
-    plt.plot(yearly_count1["Years"], yearly_count1["Yearly_counts"], label="CC BY-NC-SA 2.0", alpha=0.7, linestyle='-')
-    plt.plot(yearly_count2["Years"], yearly_count2["Yearly_counts"], label="CC BY-NC 2.0", alpha=0.7, linestyle='--')
-    plt.plot(yearly_count3["Years"], yearly_count3["Yearly_counts"], label="CC BY-NC-ND 2.0", alpha=0.7, linestyle='-.')
-    plt.plot(yearly_count4["Years"], yearly_count4["Yearly_counts"], label="CC BY 2.0", alpha=0.7, linestyle=":")
-    plt.plot(yearly_count5["Years"], yearly_count5["Yearly_counts"], label="CC BY-SA 2.0", alpha=0.7, linestyle='-')
-    plt.plot(yearly_count6["Years"], yearly_count6["Yearly_counts"], label="CC BY-ND 2.0", alpha=0.7, linestyle='--')
-    plt.plot(yearly_count9["Years"], yearly_count9["Yearly_counts"], label="CC0 1.0", alpha=0.7, linestyle=":")
-    plt.plot(yearly_count10["Years"], yearly_count10["Yearly_counts"], label="Public Domain Mark 1.0", alpha=0.7)
+    yearly_counts = [
+        time_trend_compile_helper(each_data.to_frame())
+        for each_data in list_data
+    ]
+    print(yearly_counts[0])
+
+    # plot lines of all licenses onto the same axes
+    fig, ax = plt.subplots()
+    for yearly_count, label, linestyle in zip(
+        yearly_counts, LICENSE_LABELS, LICENSE_LINESTYLES
+    ):
+        ax.plot(
+            yearly_count["Years"],
+            yearly_count["Yearly_counts"],
+            label=label,
+            alpha=0.7,
+            linestyle=linestyle,
+        )
     plt.legend()
     plt.xlabel('Date of photos taken', fontsize=10)
     plt.ylabel('Amount of photos', fontsize=10)
@@ -220,34 +217,28 @@ def time_trend_compile():
     plt.suptitle('Yearly Trend of All Licenses 2018-2022', fontsize=15, fontweight="bold")
     plt.savefig('../analyze/line_graphs/licenses_yearly_trend.png', dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
 
 
 def view_compare_helper(df):
-    highest_view = int(max(df["views"]))
-    df = df.sort_values("views", ascending=False)
+    """
+    This function returns the highest views of all pictures in df
+    """
+    highest_view = int(df["views"].max())
     return highest_view
-    print(df)
-    print(highest_view)
 
 
 def view_compare():
-    license1 = pd.read_csv("../flickr/dataset/cleaned_license1.csv")
-    license2 = pd.read_csv("../flickr/dataset/cleaned_license2.csv")
-    license3 = pd.read_csv("../flickr/dataset/cleaned_license3.csv")
-    license4 = pd.read_csv("../flickr/dataset/cleaned_license4.csv")
-    license5 = pd.read_csv("../flickr/dataset/cleaned_license5.csv")
-    license6 = pd.read_csv("../flickr/dataset/cleaned_license6.csv")
-    license9 = pd.read_csv("../flickr/dataset/cleaned_license9.csv")
-    license10 = pd.read_csv("../flickr/dataset/cleaned_license10.csv")
-    licenses = [license1, license2, license3, license4,
-                license5, license6, license9, license10]
+    # seaborn is only needed here, so import it on use
+    import seaborn as sns
+
+    licenses = load_cleaned_licenses(["views"])
     maxs = []
     for lic in licenses:
         maxs.append(view_compare_helper(lic))
     print(maxs)
     temp_data = pd.DataFrame()
-    temp_data["Licenses"] = ["CC BY-NC-SA 2.0", "CC BY-NC 2.0", "CC BY-NC-ND 2.0", "CC BY 2.0",
-                             "CC BY-SA 2.0", "CC BY-ND 2.0", "CC0 1.0", "Public Domain Mark 1.0"]
+    temp_data["Licenses"] = LICENSE_LABELS
     temp_data["views"] = maxs
     fig, ax = plt.subplots(figsize=(13, 10))
     ax.grid(b=True, color='grey',
@@ -261,16 +252,21 @@ def view_compare():
     ax.text(x=0.5, y=1.05, s='Data range: first 4000 pictures for each license',
             fontsize=13, alpha=0.75, ha='center',
             va='bottom', transform=ax.transAxes)
-    current_values = plt.gca().get_yticks()
-    plt.gca().set_yticklabels(['{:,.0f}'.format(x) for x in current_values])
+    ax.yaxis.set_major_formatter(StrMethodFormatter("{x:,.0f}"))
     plt.savefig('../analyze/compare_graphs/max_views.png', dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig)
 
 
 def total_usage():
+    # plotly is only needed here, so import it on use
+    import plotly.express as px
+
     # this will use the license total file as input dataset
-    df = pd.read_csv("../flickr/dataset/license_total.csv")
-    df["License"] = [str(x) for x in list(df["License"])]
+    # read License as string so that plotly treats it as a category
+    df = pd.read_csv(
+        "../flickr/dataset/license_total.csv", dtype={"License": str}
+    )
     fig = px.bar(df, x='License', y='Total amount', color='License')
     fig.write_html("../analyze/total_usage.html")
     # fig.show()
@@ -292,5 +288,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
-    sys.exit(1)
+        traceback.print_exc()
+        sys.exit(1)
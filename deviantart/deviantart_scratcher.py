@@ -21,6 +21,7 @@ today = dt.datetime.today()
 API_KEYS = query_secrets.API_KEYS
 API_KEYS_IND = 0
 CWD = os.path.dirname(os.path.abspath(__file__))
+LEGAL_TOOL_PATHS_FILE = f"{CWD}/legal-tool-paths.txt"
 DATA_WRITE_FILE = (
     f"{CWD}" f"/data_deviantart_{today.year}_{today.month}_{today.day}.csv"
 )
@@ -33,7 +34,7 @@ def get_license_list():
         np.array: An np array containing all license types that should be
         searched via Programmable Search Engine.
     """
-    cc_license_data = pd.read_csv(f"{CWD}/legal-tool-paths.txt", header=None)
+    cc_license_data = pd.read_csv(LEGAL_TOOL_PATHS_FILE, header=None)
     license_pattern = r"((?:[^/]+/){2}(?:[^/]+)).*"
     license_list = (
         cc_license_data[0]
@@ -69,9 +70,12 @@ def get_request_url(license):
             raise e
 
 
-def get_response_elems(license):
+def get_response_elems(session, license):
     """Provides the metadata for query of specified parameters
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         license:
             A string representing the type of license, and should be a segment
             of its URL towards the license description. Alternatively, the
@@ -84,14 +88,6 @@ def get_response_elems(license):
     """
     try:
         request_url = get_request_url(license)
-        max_retries = Retry(
-            total=5,
-            backoff_factor=10,
-            status_forcelist=[403, 408, 500, 502, 503, 504],
-            # 429 is Quota Limit Exceeded, which will be handled alternatively
-        )
-        session = requests.Session()
-        session.mount("https://", HTTPAdapter(max_retries=max_retries))
         with session.get(request_url) as response:
             response.raise_for_status()
             search_data = response.json()
@@ -106,7 +102,7 @@ def get_response_elems(license):
             print(
                 "Changing API KEYS due to depletion of quota", file=sys.stderr
             )
-            return get_response_elems(license)
+            return get_response_elems(session, license)
         else:
             raise e
 
@@ -118,35 +114,53 @@ def set_up_data_file():
         f.write(f"{header_title}\n")
 
 
-def record_license_data(license_type):
+def record_license_data(session, license_type, data_file):
     """Writes the row for LICENSE_TYPE to file to contain DeviantArt data.
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         license_type:
             A string representing the type of license, and should be a segment
             of its URL towards the license description. Alternatively, the
             default None value stands for having no assumption about license
             type.
+        data_file:
+            An open file object, in append mode, to which the row is written.
     """
     data_log = (
         f"{license_type},"
-        f"{get_response_elems(license_type)['totalResults']}"
+        f"{get_response_elems(session, license_type)['totalResults']}"
     )
-    with open(DATA_WRITE_FILE, "a") as f:
-        f.write(f"{data_log}\n")
+    data_file.write(f"{data_log}\n")
 
 
-def record_all_licenses():
+def record_all_licenses(session):
     """Records the data of all license types findable in the license list and
     records these data into the DATA_WRITE_FILE as specified in that constant.
+
+    Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
     """
     license_list = get_license_list()
-    for license_type in license_list:
-        record_license_data(license_type)
+    with open(DATA_WRITE_FILE, "a") as f:
+        for license_type in license_list:
+            record_license_data(session, license_type, f)
 
 
 def main():
+    session = requests.Session()
+    max_retries = Retry(
+        total=5,
+        backoff_factor=10,
+        status_forcelist=[403, 408, 500, 502, 503, 504],
+        # 429 is Quota Limit Exceeded, which will be handled alternatively
+    )
+    session.mount("https://", HTTPAdapter(max_retries=max_retries))
     set_up_data_file()
-    record_all_licenses()
+    record_all_licenses(session)
 
 
 if __name__ == "__main__":
@@ -159,5 +173,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
+        traceback.print_exc()
         sys.exit(1)
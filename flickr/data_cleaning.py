@@ -20,47 +20,50 @@ import traceback
 import pandas as pd
 
 
-def drop_empty_column(csv_path, new_csv_path):  # attribute is string
-    df = pd.read_csv(csv_path)
+def drop_empty_column(df):  # attribute is DataFrame
+    """
+    Drop the unnamed index columns left behind
+    by earlier DataFrame.to_csv calls
+    """
     for col in df.columns:  # to get the column list
         if "Unnamed" in col:
-            data = df.drop(col, axis=1)
+            df = df.drop(col, axis=1)
             print("Dropping column", col)
-    data.to_csv(new_csv_path)
     print("Dropping empty columns")
+    return df
 
 
-def drop_duplicate_id(csv_path, new_csv_path):  # attribute is string
-    df = pd.read_csv(csv_path)
+def drop_duplicate_id(df):  # attribute is DataFrame
     data = df.drop_duplicates(subset=["id"])
-    data.to_csv(new_csv_path)
     print("Dropping duplicates")
+    return data
 
 
 def save_new_data(
-    csv_path, column_name_list, new_csv_path
-):  # attribute is string
+    df, column_name_list, new_csv_path
+):  # attribute df is DataFrame, the others are string
     """
     column_name_list must belongs to the
     existing column names from original csv
-    csv_path is the path of original csv
+    df is the dataframe read from the original csv
     This function generate a new dataframe
     to save final data with useful columns
+    and is the only step writing to new_csv_path
     """
-    df = pd.read_csv(csv_path)
-    new_df = pd.DataFrame()
-    for col in column_name_list:
-        new_df[col] = list(df[col])
-        print("Saving column", col)
+    new_df = df[column_name_list].reset_index(drop=True)
+    print("Saving columns", ", ".join(column_name_list))
     new_df.to_csv(new_csv_path)
     print("Saving new data to new csv")
 
 
 def main():
-    drop_empty_column("final.csv", "dataset/cleaned_license10.csv")
-    drop_duplicate_id("dataset/cleaned_license10.csv", "dataset/cleaned_license10.csv")
+    # read the pulled data once and clean it in memory
+    # so that the cleaned csv is only written once
+    df = pd.read_csv("final.csv")
+    df = drop_empty_column(df)
+    df = drop_duplicate_id(df)
     save_new_data(
-        "dataset/cleaned_license10.csv",
+        df,
         ["location", "dates", "license", "description", "tags", "views", "comments"],
         "dataset/cleaned_license10.csv",
     )
@@ -76,5 +79,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
-    sys.exit(1)
+        traceback.print_exc()
+        sys.exit(1)
@@ -34,5 +34,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
-    sys.exit(1)
+        traceback.print_exc()
+        sys.exit(1)
@@ -9,6 +9,7 @@ step3: saving lists of data to DataFrame
 
 # Standard library
 import json
+import os
 import sys
 import traceback
 import time
@@ -24,7 +25,6 @@ def to_df(datalist, namelist):
     this is to transform pulled and queried data into dataframe
     by iterating through the list of columns
     """
-    df = [pd.DataFrame() for ind in range(len(datalist))]
     df = pd.DataFrame(datalist).transpose()
     df.columns = namelist
     return df
@@ -36,15 +36,16 @@ def df_to_csv(temp_list, name_list, temp_csv, final_csv):
     temp_csv is the csv that used for saving data every 100 seconds
     temp_csv is set to prevent data from losing when script stops
     final_csv is the final csv for one certain license
-    pd.concat(map...) means to merge temp CSV to final CSV
+    the page is appended to final_csv instead of reading and rewriting
+    the whole file, and the header is only written when it is empty
     both temp_csv and final_csv should be path in form of string
-    note that the map(pd.read_csv) means overwrite data
-    so duplicate issue solved
     """
     df = to_df(temp_list, name_list)
     df.to_csv(temp_csv)
-    df = pd.concat(map(pd.read_csv, [temp_csv, final_csv]), ignore_index=True)
-    df.to_csv(final_csv)
+    write_header = (
+        not os.path.exists(final_csv) or os.path.getsize(final_csv) == 0
+    )
+    df.to_csv(final_csv, mode="a", header=write_header)
 
 
 def creat_lisoflis(size):
@@ -62,10 +63,22 @@ def clean_saveas_csv(old_csv_str, new_csv_str):
     clean empty columns and save the csv to a new one
     """
     data = pd.read_csv(old_csv_str, low_memory=False)
-    for col in list(data.columns):
-        if "Unnamed" in col:
-            data.drop(col, inplace=True, axis=1)
-    data.to_csv(new_csv_str)
+    unnamed_cols = [col for col in data.columns if "Unnamed" in col]
+    data.drop(columns=unnamed_cols).to_csv(new_csv_str)
+
+
+def normalize_final_csv(final_csv, name_list):
+    """
+    final_csv files written by older versions of this script carry
+    one extra unnamed index column per saved page, which would shift
+    the rows appended by df_to_csv, so rewrite such a file once
+    with only the index and the name_list columns before resuming
+    """
+    if not os.path.exists(final_csv) or os.path.getsize(final_csv) == 0:
+        return
+    columns = list(pd.read_csv(final_csv, nrows=0).columns)
+    if columns != ["Unnamed: 0", *name_list]:
+        clean_saveas_csv(final_csv, final_csv)
 
 
 def query_helper1(raw, part, detail, temp_list, index):
@@ -132,13 +145,25 @@ def page1_reset(final_csv, raw_data):
     and set the final CSV as empty if is at the 1st page
     final_csv is the path in the form of string
     """
-    data = pd.read_csv(final_csv, low_memory=False)
-    for col in list(data.columns):
-        data.drop(col, inplace=True, axis=1)
-        data.to_csv(final_csv)
+    # truncate the file once instead of dropping and saving every column
+    with open(final_csv, "w"):
+        pass
     return raw_data["photos"]["pages"]
 
 
+def save_rec(rec_path, j, i, total):
+    """
+    save j(current page), i(current license), and total to rec_path
+    the record is written to a temporary file first and then
+    moved over rec_path, so the script never resumes from a
+    half-written record if it stops during the write
+    """
+    temp_path = rec_path + ".tmp"
+    with open(temp_path, "w") as f:
+        f.write(str(j) + " " + str(i) + " " + str(total))
+    os.replace(temp_path, rec_path)
+
+
 retries = 0
 
 
@@ -177,6 +202,9 @@ def main():
         j = int(readed[0])
         i = int(readed[1])
         total = int(readed[2])
+    # resuming in the middle of a license appends to the existing final csv
+    if j != 1:
+        normalize_final_csv("final.csv", name_list)
     while i in license_list:
         while j <= total:
             # use search method to pull photo id in each license
@@ -230,8 +258,7 @@ def main():
             # save csv
             df_to_csv(temp_list, name_list, "hs.csv", "final.csv")
             # update j(the current page number in txt)
-            with open("rec.txt", "w") as f:
-                f.write(str(j) + " " + str(i) + " " + str(total))
+            save_rec("rec.txt", j, i, total)
 
             # set list to empty everytime after saving the data into
             # the csv file to prevent from saving duplicate data
@@ -245,8 +272,7 @@ def main():
                 j = 1
                 while i not in license_list:
                     i += 1
-                with open("rec.txt", "w") as f:
-                    f.write(str(j) + " " + str(i) + " " + str(total))
+                save_rec("rec.txt", j, i, total)
 
                 # below is to clear list everytime
                 # before rerun (to prevent duplicate)
@@ -266,7 +292,7 @@ if __name__ == "__main__":
         except Exception as e:
             retries += 1
             print("ERROR (1) Unhandled exception:", file=sys.stderr)
-            print(traceback.print_exc(), file=sys.stderr)
+            traceback.print_exc()
             if retries <= 20:
                 continue
             else:
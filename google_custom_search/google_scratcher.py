@@ -6,6 +6,7 @@ Data.
 
 # Standard library
 import datetime as dt
+import functools
 import os
 import sys
 import traceback
@@ -21,6 +22,9 @@ today = dt.datetime.today()
 API_KEYS = query_secrets.API_KEYS
 API_KEYS_IND = 0
 CWD = os.path.dirname(os.path.abspath(__file__))
+COUNTRY_LIST_FILE = f"{CWD}/google_countries.tsv"
+LANGUAGE_LIST_FILE = f"{CWD}/google_lang.txt"
+LEGAL_TOOL_PATHS_FILE = f"{CWD}/legal-tool-paths.txt"
 DATA_WRITE_FILE = (
     f"{CWD}"
     f"/data_google_custom_search_{today.year}_{today.month}_{today.day}.csv"
@@ -46,7 +50,7 @@ def get_license_list():
         np.array: An np array containing all license types that should be
         searched via Programmable Search Engine.
     """
-    cc_license_data = pd.read_csv(f"{CWD}/legal-tool-paths.txt", header=None)
+    cc_license_data = pd.read_csv(LEGAL_TOOL_PATHS_FILE, header=None)
     license_pattern = r"((?:[^/]+/){2}(?:[^/]+)).*"
     license_list = (
         cc_license_data[0]
@@ -57,15 +61,19 @@ def get_license_list():
     return license_list
 
 
+@functools.lru_cache(maxsize=None)
 def get_lang_list():
     """Provides the list of language to find Creative Commons usage data on.
 
+    The list is read from file once and cached, as it is requested for every
+    license type recorded. The returned DataFrame must not be modified.
+
     Returns:
         pd.DataFrame: A Dataframe whose index is language name and has a column
         for the corresponding language code.
     """
     languages = pd.read_csv(
-        f"{CWD}/google_lang.txt", sep=": ", header=None, engine="python"
+        LANGUAGE_LIST_FILE, sep=": ", header=None, engine="python"
     )
     languages[0] = languages[0].str.extract(r'"([^"]+)"')
     languages = languages.set_index(1)
@@ -86,9 +94,14 @@ def get_lang_list():
     return selected_languages
 
 
+@functools.lru_cache(maxsize=None)
 def get_country_list(select_all=False):
     """Provides the list of countries to find Creative Commons usage data on.
 
+    The list is read from file once per value of select_all and cached, as it
+    is requested for every license type recorded. The returned DataFrame must
+    not be modified.
+
     Args:
         select_all:
             A boolean indicating whether the returned list will have all
@@ -98,7 +111,7 @@ def get_country_list(select_all=False):
         pd.DataFrame: A Dataframe whose index is country name and has a column
         for the corresponding country code.
     """
-    countries = pd.read_csv(CWD + "/google_countries.tsv", sep="\t")
+    countries = pd.read_csv(COUNTRY_LIST_FILE, sep="\t")
     countries["Country"] = countries["Country"].str.replace(",", " ")
     countries = countries.set_index("Country").sort_index()
     if select_all:
@@ -173,10 +186,15 @@ def get_request_url(license=None, country=None, language=None, time=False):
             raise e
 
 
-def get_response_elems(license=None, country=None, language=None, time=False):
+def get_response_elems(
+    session, license=None, country=None, language=None, time=False
+):
     """Provides the metadata for query of specified parameters
 
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         license:
             A string representing the type of license, and should be a segment
             of its URL towards the license description. Alternatively, the
@@ -201,14 +219,6 @@ def get_response_elems(license=None, country=None, language=None, time=False):
     """
     try:
         request_url = get_request_url(license, country, language, time)
-        max_retries = Retry(
-            total=5,
-            backoff_factor=10,
-            status_forcelist=[400, 403, 408, 500, 502, 503, 504],
-            # 429 is Quota Limit Exceeded, which will be handled alternatively
-        )
-        session = requests.Session()
-        session.mount("https://", HTTPAdapter(max_retries=max_retries))
         with session.get(request_url) as response:
             response.raise_for_status()
             search_data = response.json()
@@ -223,7 +233,9 @@ def get_response_elems(license=None, country=None, language=None, time=False):
             print(
                 "Changing API KEYS due to depletion of quota", file=sys.stderr
             )
-            return get_response_elems(license, country, language, time)
+            return get_response_elems(
+                session, license, country, language, time
+            )
         else:
             print(f"Request URL was {request_url}", file=sys.stderr)
             raise e
@@ -253,10 +265,13 @@ def set_up_data_file():
         f.write(f"{header_title_country}\n")
 
 
-def record_license_data(license_type=None, time=False, country=False):
+def record_license_data(session, license_type=None, time=False, country=False):
     """Writes the row for LICENSE_TYPE to file to contain Google Query data.
 
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         license:
             A string representing the type of license, and should be a segment
             of its URL towards the license description. Alternatively, the
@@ -269,67 +284,84 @@ def record_license_data(license_type=None, time=False, country=False):
             A boolean indicating whether this query is related to country
             occurrence.
     """
+    # Collect the row fields and join them once when writing
     if license_type is None:
-        data_log = "all"
+        data_log = ["all"]
     else:
-        data_log = f"{license_type}"
+        data_log = [f"{license_type}"]
     if country:
         all_countries = get_country_list(select_all=True)
         for current_country in all_countries.iloc[:, 0]:
             country_license_data = get_response_elems(
-                license=license_type, country=current_country
+                session, license=license_type, country=current_country
             )
-            data_log = f"{data_log},{country_license_data['totalResults']}"
-        data_log = f"{data_log}\nAll Documents"
+            data_log.append(f"{country_license_data['totalResults']}")
+        overall_log = ["All Documents"]
         for current_country in all_countries.iloc[:, 0]:
             country_overall_data = get_response_elems(
-                license="no", country=current_country
+                session, license="no", country=current_country
             )
-            data_log = f"{data_log},{country_overall_data['totalResults']}"
+            overall_log.append(f"{country_overall_data['totalResults']}")
         with open(DATA_WRITE_FILE_COUNTRY, "a") as f:
-            f.write(f"{data_log}\n")
+            f.write(",".join(data_log) + "\n")
+            f.write(",".join(overall_log) + "\n")
     elif time:
         for i in range(SEARCH_HALFYEAR_SPAN):
-            time_data = get_response_elems(license=license_type, time=i * 6)
-            data_log = f"{data_log},{time_data['totalResults']}"
+            time_data = get_response_elems(
+                session, license=license_type, time=i * 6
+            )
+            data_log.append(f"{time_data['totalResults']}")
         with open(DATA_WRITE_FILE_TIME, "a") as f:
-            f.write(f"{data_log}\n")
+            f.write(",".join(data_log) + "\n")
     else:
         selected_countries = get_country_list()
         selected_languages = get_lang_list()
-        no_priori_search = get_response_elems(license=license_type)
-        data_log += f",{no_priori_search['totalResults']}"
+        no_priori_search = get_response_elems(session, license=license_type)
+        data_log.append(f"{no_priori_search['totalResults']}")
         for country_name in selected_countries.iloc[:, 0]:
             response = get_response_elems(
-                license=license_type, country=country_name
+                session, license=license_type, country=country_name
             )
-            data_log = f"{data_log},{response['totalResults']}"
+            data_log.append(f"{response['totalResults']}")
         for language_name in selected_languages.iloc[:, 0]:
             response = get_response_elems(
-                license=license_type, language=language_name
+                session, license=license_type, language=language_name
             )
-            data_log = f"{data_log},{response['totalResults']}"
+            data_log.append(f"{response['totalResults']}")
         with open(DATA_WRITE_FILE, "a") as f:
-            f.write(f"{data_log}\n")
+            f.write(",".join(data_log) + "\n")
 
 
-def record_all_licenses():
+def record_all_licenses(session):
     """Records the data of all license types findable in the license list and
     records these data into the DATA_WRITE_FILE and DATA_WRITE_FILE_TIME as
     specified in that constant.
+
+    Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
     """
     license_list = get_license_list()
-    record_license_data(time=False)
-    record_license_data(time=True)
-    record_license_data(country=True)
+    record_license_data(session, time=False)
+    record_license_data(session, time=True)
+    record_license_data(session, country=True)
     for license_type in license_list:
-        record_license_data(license_type, time=False)
-        record_license_data(license_type, time=True)
+        record_license_data(session, license_type, time=False)
+        record_license_data(session, license_type, time=True)
 
 
 def main():
+    session = requests.Session()
+    max_retries = Retry(
+        total=5,
+        backoff_factor=10,
+        status_forcelist=[400, 403, 408, 500, 502, 503, 504],
+        # 429 is Quota Limit Exceeded, which will be handled alternatively
+    )
+    session.mount("https://", HTTPAdapter(max_retries=max_retries))
     set_up_data_file()
-    record_all_licenses()
+    record_all_licenses(session)
 
 
 if __name__ == "__main__":
@@ -342,5 +374,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
+        traceback.print_exc()
         sys.exit(1)
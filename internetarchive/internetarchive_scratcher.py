@@ -10,7 +10,6 @@ import sys
 import traceback
 
 # Third-party
-import pandas as pd
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -20,6 +19,7 @@ from internetarchive.session import ArchiveSession
 
 today = dt.datetime.today()
 CWD = os.path.dirname(os.path.abspath(__file__))
+LEGAL_TOOL_PATHS_FILE = f"{CWD}/legal-tool-paths.txt"
 DATA_WRITE_FILE = (
     f"{CWD}"
     f"/data_internetarchive_{today.year}_{today.month}_{today.day}.csv"
@@ -29,11 +29,13 @@ DATA_WRITE_FILE = (
 def get_license_list():
     """Provides the list of license from a Creative Commons provided tool list.
     Returns:
-        np.array: An np array containing all license types that should be
-        searched via Programmable Search Engine.
+        list: A list containing all license types that should be searched via
+        Internet Archive, without duplicates and in order of appearance.
     """
-    cc_license_data = pd.read_csv(f"{CWD}/legal-tool-paths.txt", header=None)
-    license_list = cc_license_data[0].unique()
+    with open(LEGAL_TOOL_PATHS_FILE) as f:
+        license_list = list(
+            dict.fromkeys(line.strip() for line in f if line.strip())
+        )
     return license_list
 
 
@@ -78,7 +80,7 @@ def set_up_data_file():
         f.write(f"{header_title}\n")
 
 
-def record_license_data(license_type):
+def record_license_data(license_type, data_file):
     """Writes the row for LICENSE_TYPE to file to contain IA Query data.
     Args:
         license_type:
@@ -86,13 +88,14 @@ def record_license_data(license_type):
             of its URL towards the license description. Alternatively, the
             default None value stands for having no assumption about license
             type.
+        data_file:
+            An open file object, in append mode, to which the row is written.
     """
     data_log = (
         f"{license_type},"
         f"{get_response_elems(license_type)['totalResults']}"
     )
-    with open(DATA_WRITE_FILE, "a") as f:
-        f.write(f"{data_log}\n")
+    data_file.write(f"{data_log}\n")
 
 
 def record_all_licenses():
@@ -100,8 +103,9 @@ def record_all_licenses():
     records these data into the DATA_WRITE_FILE as specified in that constant.
     """
     license_list = get_license_list()
-    for license_type in license_list:
-        record_license_data(license_type)
+    with open(DATA_WRITE_FILE, "a") as f:
+        for license_type in license_list:
+            record_license_data(license_type, f)
 
 
 def main():
@@ -119,5 +123,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
+        traceback.print_exc()
         sys.exit(1)
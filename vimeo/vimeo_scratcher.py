@@ -66,9 +66,12 @@ def get_request_url(license="CC"):
     )
 
 
-def get_response_elems(license):
+def get_response_elems(session, license):
     """Provides the metadata for query of specified parameters
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         license:
             A string representing the type of license, and should be a segment
             of its URL towards the license description. Alternatively, the
@@ -80,13 +83,6 @@ def get_response_elems(license):
     """
     try:
         request_url = get_request_url(license=license)
-        max_retries = Retry(
-            total=5,
-            backoff_factor=10,
-            status_forcelist=[403, 408, 429, 500, 502, 503, 504],
-        )
-        session = requests.Session()
-        session.mount("https://", HTTPAdapter(max_retries=max_retries))
         with session.get(request_url) as response:
             response.raise_for_status()
             search_data = response.json()
@@ -102,35 +98,52 @@ def set_up_data_file():
         f.write(f"{header_title}\n")
 
 
-def record_license_data(license_type):
+def record_license_data(session, license_type, data_file):
     """Writes the row for LICENSE_TYPE to file to contain Vimeo Query data.
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         license_type:
             A string representing the type of license, and should be a segment
             of its URL towards the license description. Alternatively, the
             default None value stands for having no assumption about license
             type.
+        data_file:
+            An open file object, in append mode, to which the row is written.
     """
     data_log = (
         f"{license_type},"
-        f"{get_response_elems(license_type)['totalResults']}"
+        f"{get_response_elems(session, license_type)['totalResults']}"
     )
-    with open(DATA_WRITE_FILE, "a") as f:
-        f.write(f"{data_log}\n")
+    data_file.write(f"{data_log}\n")
 
 
-def record_all_licenses():
+def record_all_licenses(session):
     """Records the data of all license types findable in the license list and
     records these data into the DATA_WRITE_FILE as specified in that constant.
+
+    Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
     """
     license_list = get_license_list()
-    for license_type in license_list:
-        record_license_data(license_type)
+    with open(DATA_WRITE_FILE, "a") as f:
+        for license_type in license_list:
+            record_license_data(session, license_type, f)
 
 
 def main():
+    max_retries = Retry(
+        total=5,
+        backoff_factor=10,
+        status_forcelist=[403, 408, 429, 500, 502, 503, 504],
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=max_retries))
     set_up_data_file()
-    record_all_licenses()
+    record_all_licenses(session)
 
 
 if __name__ == "__main__":
@@ -143,5 +156,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
+        traceback.print_exc()
         sys.exit(1)
@@ -166,7 +166,7 @@ def set_up_data_file():
         f.write(header_title)
 
 
-def record_license_data(license_type, license_alias, session):
+def record_license_data(license_type, license_alias, session, data_file):
     """Writes the row for LICENSE_TYPE to file to contain WikiCommon Query.
 
     Args:
@@ -182,6 +182,8 @@ def record_license_data(license_type, license_alias, session):
         session:
             A requests.Session object for accessing API endpoints and
             retrieving API endpoint responses.
+        data_file:
+            An open file object, in append mode, to which the row is written.
     """
     search_result = get_license_contents(license_type, session)
     cleaned_alias = license_alias.replace(",", "|")
@@ -189,8 +191,7 @@ def record_license_data(license_type, license_alias, session):
         f"{cleaned_alias},"
         f"{search_result['total_file_cnt']},{search_result['total_page_cnt']}"
     )
-    with open(DATA_WRITE_FILE, "a") as f:
-        f.write(f"{data_log}\n")
+    data_file.write(f"{data_log}\n")
 
 
 def recur_record_all_licenses(license_alias="Free_Creative_Commons_licenses"):
@@ -219,16 +220,17 @@ def recur_record_all_licenses(license_alias="Free_Creative_Commons_licenses"):
     session.mount("https://", HTTPAdapter(max_retries=max_retries))
 
     def recursive_traversing_subroutine(alias):
-        alias.replace(",", "|")
         cur_category = alias.split("/")[-1]
-        subcategories = get_subcategories(cur_category, session)
+        # Only query the subcategories of categories not yet recorded
         if cur_category not in license_cache:
-            record_license_data(cur_category, alias, session)
+            subcategories = get_subcategories(cur_category, session)
+            record_license_data(cur_category, alias, session, data_file)
             license_cache[cur_category] = True
             for cats in subcategories:
                 recursive_traversing_subroutine(f"{alias}/{cats}")
 
-    recursive_traversing_subroutine(license_alias)
+    with open(DATA_WRITE_FILE, "a") as data_file:
+        recursive_traversing_subroutine(license_alias)
 
 
 def main():
@@ -246,5 +248,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
+        traceback.print_exc()
         sys.exit(1)
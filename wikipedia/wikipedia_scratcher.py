@@ -17,6 +17,7 @@ from urllib3.util.retry import Retry
 
 today = dt.datetime.today()
 CWD = os.path.dirname(os.path.abspath(__file__))
+LANGUAGE_CODES_FILE = f"{CWD}/language-codes_csv.csv"
 DATA_WRITE_FILE = (
     f"{CWD}" f"/data_wikipedia_{today.year}_{today.month}_{today.day}.csv"
 )
@@ -34,7 +35,7 @@ def get_wiki_langs():
         pd.DataFrame: A Dataframe containing information of each Wikipedia
         language and its respective encoding on web address.
     """
-    return pd.read_csv(f"{CWD}/language-codes_csv.csv")
+    return pd.read_csv(LANGUAGE_CODES_FILE)
 
 
 def get_request_url(lang="en"):
@@ -58,10 +59,13 @@ def get_request_url(lang="en"):
     return base_url
 
 
-def get_response_elems(language="en"):
+def get_response_elems(session, language="en"):
     """Provides the metadata for query of specified parameters
 
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         language:
             A string representing the language that the search results are
             presented in. Alternatively, the default value is by Wikipedia
@@ -74,16 +78,9 @@ def get_response_elems(language="en"):
     search_data = None
     try:
         request_url = get_request_url(language)
-        max_retries = Retry(
-            total=5,
-            backoff_factor=10,
-            status_forcelist=[403, 408, 429, 500, 502, 503, 504],
-        )
-        session = requests.Session()
-        session.mount("https://", HTTPAdapter(max_retries=max_retries))
         with session.get(request_url) as response:
             response.raise_for_status()
-            search_data = requests.get(request_url).json()
+            search_data = response.json()
             search_data_dict = search_data["query"]["statistics"]
             search_data_dict["language"] = language
         return search_data_dict
@@ -93,7 +90,7 @@ def get_response_elems(language="en"):
                 f"Received Result is None due to Language {language} absent as"
                 "an available Wikipedia client. Will therefore return an empty"
                 "dictionary for result, but will continue querying.",
-                file=sys.stderr
+                file=sys.stderr,
             )
             return {}
         elif "query" not in search_data:
@@ -103,37 +100,61 @@ def get_response_elems(language="en"):
             raise e
 
 
-def set_up_data_file():
-    """Writes the header row to file to contain Wikipedia Query data."""
-    header_title = ",".join(get_response_elems())
+def set_up_data_file(en_data):
+    """Writes the header row to file to contain Wikipedia Query data.
+
+    Args:
+        en_data:
+            A dictionary of the "en" query result, as returned by
+            get_response_elems.
+    """
+    header_title = ",".join(en_data)
     with open(DATA_WRITE_FILE, "w") as f:
         f.write(f"{header_title}\n")
 
 
-def record_lang_data(lang="en"):
+def record_lang_data(session, data_file, lang="en", response=None):
     """Writes the row for LICENSE_TYPE to file to contain Google Query data.
 
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
+        data_file:
+            An open file object, in append mode, to which the row is written.
         lang:
             A string representing the language that the search results are
             presented in. Alternatively, the default value is by Wikipedia
             customs "en".
+        response:
+            A dictionary of the result already queried for lang, if any. The
+            language is queried again when it is None or empty.
     """
-    response = get_response_elems(lang)
+    if not response:
+        response = get_response_elems(session, lang)
     if response != {}:
         response_values = response.values()
         response_str = [str(elem) for elem in response_values]
-        with open(DATA_WRITE_FILE, "a") as f:
-            f.write(",".join(response_str) + "\n")
+        data_file.write(",".join(response_str) + "\n")
 
 
-def record_all_licenses():
+def record_all_licenses(session, en_data):
     """Records the data of all language types findable in the language list and
     records these data into the DATA_WRITE_FILE as specified in that constant.
+
+    Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
+        en_data:
+            A dictionary of the "en" query result, as returned by
+            get_response_elems.
     """
     wiki_langs = get_wiki_langs()
-    for iso_language_code in wiki_langs["alpha2"]:
-        record_lang_data(iso_language_code)
+    with open(DATA_WRITE_FILE, "a") as f:
+        for iso_language_code in wiki_langs["alpha2"]:
+            response = en_data if iso_language_code == "en" else None
+            record_lang_data(session, f, iso_language_code, response)
 
 
 def get_current_data():
@@ -148,8 +169,17 @@ def get_current_data():
 
 
 def main():
-    set_up_data_file()
-    record_all_licenses()
+    max_retries = Retry(
+        total=5,
+        backoff_factor=10,
+        status_forcelist=[403, 408, 429, 500, 502, 503, 504],
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=max_retries))
+    # the "en" result provides the header and is reused for its own row
+    en_data = get_response_elems(session, "en")
+    set_up_data_file(en_data)
+    record_all_licenses(session, en_data)
 
 
 if __name__ == "__main__":
@@ -162,5 +192,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
+        traceback.print_exc()
         sys.exit(1)
@@ -5,6 +5,7 @@ Data.
 """
 
 # Standard library
+import calendar
 import datetime as dt
 import os
 import sys
@@ -38,19 +39,10 @@ def get_next_time_search_interval():
     """
     cur_year, cur_month = 2009, 1
     while cur_year * 100 + cur_month <= today.year * 100 + today.month:
-        end_month, end_day = 12, 31
-        if cur_month == 1:
-            end_month, end_day = 2, 28 + int(cur_year % 4 == 0)
-        elif cur_month == 3:
-            end_month, end_day = 4, 30
-        elif cur_month == 5:
-            end_month, end_day = 6, 30
-        elif cur_month == 7:
-            end_month, end_day = 8, 31
-        elif cur_month == 9:
-            end_month, end_day = 10, 31
-        elif cur_month == 11:
-            end_month, end_day = 12, 31
+        # Each interval spans two months, ending on the last day of the
+        # second one
+        end_month = cur_month + 1
+        end_day = calendar.monthrange(cur_year, end_month)[1]
         yield (
             f"{cur_year}-{cur_month}-01T00:00:00Z",
             f"{cur_year}-{end_month}-{end_day}T23:59:59Z",
@@ -88,10 +80,13 @@ def get_request_url(time=None):
     return f"{base_url}key={API_KEY}"
 
 
-def get_response_elems(time=None):
+def get_response_elems(session, time=None):
     """Provides the metadata for query of specified parameters
 
     Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
         time: A tuple indicating whether this query is related to video time
         occurrence, and the time interval which it would like to investigate.
         Defaults to None to indicate the query is not related to video time
@@ -104,13 +99,6 @@ def get_response_elems(time=None):
     search_data = None
     try:
         request_url = get_request_url(time=time)
-        max_retries = Retry(
-            total=5,
-            backoff_factor=10,
-            status_forcelist=[403, 408, 429, 500, 502, 503, 504],
-        )
-        session = requests.Session()
-        session.mount("https://", HTTPAdapter(max_retries=max_retries))
         with session.get(request_url) as response:
             response.raise_for_status()
             search_data = response.json()
@@ -131,35 +119,52 @@ def set_up_data_file():
         f.write("LICENSE TYPE,Time,Document Count\n")
 
 
-def record_all_licenses():
+def record_all_licenses(session):
     """Records the data of all license types findable in the license list and
     records these data into the DATA_WRITE_FILE as specified in that constant.
+
+    Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
     """
     with open(DATA_WRITE_FILE, "a") as f:
         f.write(
             "licenses/by/3.0,"
-            f"{get_response_elems()['pageInfo']['totalResults']}\n"
+            f"{get_response_elems(session)['pageInfo']['totalResults']}\n"
         )
 
 
-def record_all_licenses_time():
+def record_all_licenses_time(session):
     """Records the data of all license types findable in the license list and
     records these data into the DATA_WRITE_FILE as specified in that constant.
+
+    Args:
+        session:
+            A requests.Session object for accessing API endpoints and
+            retrieving API endpoint responses.
     """
     with open(DATA_WRITE_FILE_TIME, "a") as f:
         for time in get_next_time_search_interval():
+            search_data = get_response_elems(session, time=time)
             f.write(
                 "licenses/by/3.0,"
                 f"{time[2]}-{time[3]},"
-                f"{get_response_elems(time=time)['pageInfo']['totalResults']}"
-                "\n"
+                f"{search_data['pageInfo']['totalResults']}\n"
             )
 
 
 def main():
+    max_retries = Retry(
+        total=5,
+        backoff_factor=10,
+        status_forcelist=[403, 408, 429, 500, 502, 503, 504],
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=max_retries))
     set_up_data_file()
-    record_all_licenses()
-    record_all_licenses_time()
+    record_all_licenses(session)
+    record_all_licenses_time(session)
 
 
 if __name__ == "__main__":
@@ -172,5 +177,5 @@ if __name__ == "__main__":
         sys.exit(130)
     except Exception:
         print("ERROR (1) Unhandled exception:", file=sys.stderr)
-        print(traceback.print_exc(), file=sys.stderr)
+        traceback.print_exc()
         sys.exit(1)